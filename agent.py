@@ -4,52 +4,161 @@ Demonstrates true agentic behavior with autonomous decision-making, planning, an
 """
 
 import google.generativeai as genai
-from typing import Dict, List, Any, Optional
-import json
+from google.generativeai import client as genai_client
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional, Tuple
+import asyncio
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import hashlib
+import threading
 
+import orjson
+from typing_extensions import TypedDict  # pydantic (used by the SDK's schema conversion) rejects typing.TypedDict before 3.12
 
-class EducationAgent:
+
+_CACHE_MAX_ENTRIES = 256  # Cached LLM responses kept per agent
+_HISTORY_MAX_ENTRIES = 50  # Doubt Q/A pairs kept in conversation_history
+_DECISION_LOG_MAX_ENTRIES = 200  # Most recent decisions kept in decision_log
+_PLAN_CACHE_MAX_ENTRIES = 1024  # Next-topic suggestions shared across agents
+_MODELS_MAX_ENTRIES = 16  # Per-key model handles (each holds a gRPC client) kept process-wide
+_MAX_CONCURRENT_REQUESTS = 16  # In-flight Gemini calls per batch, to stay clear of rate limits
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+_configure_lock = threading.Lock()  # genai.configure is process-wide; hold this while binding a model's client
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+    return _loop
+
+
+async def _abind_model(api_key: str, model_name: str) -> genai.GenerativeModel:
     """
-    Autonomous AI agent that:
-    1. Analyzes student's learning context and needs
-    2. Plans personalized learning path
-    3. Executes multi-step learning strategies
-    4. Adapts based on student responses
+    Create a model whose async client is pinned to api_key. Models otherwise build their client
+    lazily from whatever key genai was last configured with; this runs on the shared loop because
+    the gRPC client binds to the loop it is created on.
     """
-    
-    def __init__(self, api_key: str, native_language: str = "Hindi"):
+    with _configure_lock:
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        self.native_language = native_language
-        self.conversation_history = []
-        self.decision_log = []  # Track agent's autonomous decisions
-        self.student_profile = {
-            "language": native_language,
-            "difficulty_level": "beginner",
-            "learning_style": "visual",
-            "topics_covered": [],
-            "weak_areas": [],
-            "strengths": [],
-            "engagement_level": "high"
-        }
+        model = genai.GenerativeModel(model_name)
+        # Private attribute of google-generativeai 0.8.3 (pinned in requirements.txt): the model's lazily
+        # created async client. Re-check this when upgrading the SDK
+        model._async_client = genai_client.get_default_generative_async_client()
+    return model
+
+
+_END_OF_STREAM = object()
+
+
+async def _anext_or_end(agen: AsyncIterator[str]):
+    """Await the next item of an async iterator, returning _END_OF_STREAM when it's exhausted"""
+    try:
+        return await agen.__anext__()
+    except StopAsyncIteration:
+        return _END_OF_STREAM
+
+
+def _iter_sync(agen: AsyncIterator[str]) -> Iterator[str]:
+    """Iterate an async iterator from synchronous code, one item at a time on the shared loop"""
+    while True:
+        item = _run_sync(_anext_or_end(agen))
+        if item is _END_OF_STREAM:
+            return
+        yield item
+
+
+def _kv(data: Dict[str, Any]) -> str:
+    """Render a flat dict as "key: value" lines (lists comma-joined) - fewer prompt tokens than JSON"""
+    return "\n".join(
+        f"{key}: {', '.join(map(str, value)) if isinstance(value, list) else value}"
+        for key, value in data.items()
+    )
+
+
+def _run_sync(coro):
+    """Run a coroutine on the shared loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+@dataclass(slots=True)
+class StudentState:
+    """Agent's understanding of the student, read on every decision"""
+    language: str = "Hindi"
+    difficulty_level: str = "beginner"
+    learning_style: str = "visual"
+    topics_covered: List[str] = field(default_factory=list)
+    weak_areas: List[str] = field(default_factory=list)
+    strengths: List[str] = field(default_factory=list)
+    engagement_level: str = "high"
     
-    def log_decision(self, decision_type: str, reasoning: str, action: str):
-        """Log agent's autonomous decisions for transparency"""
-        self.decision_log.append({
-            "type": decision_type,
-            "reasoning": reasoning,
-            "action": action,
-            "timestamp": len(self.decision_log) + 1
-        })
-        
-    def analyze_content(self, content: str, content_type: str = "text") -> Dict[str, Any]:
-        """
-        Agent autonomously analyzes content and decides learning strategy
-        """
-        prompt = f"""You are an autonomous educational AI agent. Analyze this content and create a comprehensive learning plan.
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the state (the student_profile shape)"""
+        return {
+            "language": self.language,
+            "difficulty_level": self.difficulty_level,
+            "learning_style": self.learning_style,
+            "topics_covered": list(self.topics_covered),
+            "weak_areas": list(self.weak_areas),
+            "strengths": list(self.strengths),
+            "engagement_level": self.engagement_level
+        }
 
-Content Type: {content_type}
-Content: {content}
+
+class ContentAnalysis(TypedDict):
+    """Response schema for analyze_content"""
+    main_topic: str
+    difficulty_level: str
+    key_concepts: List[str]
+    prerequisites: List[str]
+    learning_plan: List[str]
+    confusion_points: List[str]
+    teaching_strategy: str
+
+
+class QuizQuestion(TypedDict):
+    """Response schema for one generate_interactive_quiz question"""
+    type: str
+    question: str
+    options: List[str]
+    correct: str
+    explanation: str
+
+
+class LearningAdaptation(TypedDict):
+    """Response schema for adaptive_learning_path"""
+    is_correct: bool
+    misconception: str
+    next_action: str
+    recommended_difficulty: str
+    additional_topics: List[str]
+
+
+# JSON mode: Gemini returns schema-constrained JSON with no markdown fences
+_ANALYSIS_CFG = genai.types.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=ContentAnalysis
+)
+_QUIZ_CFG = genai.types.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=list[QuizQuestion]  # The SDK only accepts builtin generics here, not typing.List
+)
+_ADAPTATION_CFG = genai.types.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=LearningAdaptation
+)
+
+
+# Prompt templates. Static instructions (role, rules, JSON schema) come first and the
+# per-call content last, so the prompt prefix is byte-identical across calls.
+_ANALYZE_TMPL = """You are an autonomous educational AI agent. Analyze this content and create a comprehensive learning plan.
 
 Your task (think step-by-step):
 1. Identify the main concepts and difficulty level
@@ -68,64 +177,40 @@ Respond in JSON format with:
     "confusion_points": ["point1", "point2"],
     "teaching_strategy": "recommended approach"
 }}
+
+Content Type: {content_type}
+Content: {content}
 """
-        
-        response = self.model.generate_content(prompt)
-        try:
-            analysis = json.loads(response.text.strip().replace("```json", "").replace("```", ""))
-            
-            # Log agent's autonomous decision
-            self.log_decision(
-                decision_type="Content Analysis",
-                reasoning=f"Identified as {analysis.get('difficulty_level', 'unknown')} level topic requiring {analysis.get('teaching_strategy', 'standard')} approach",
-                action=f"Planning {len(analysis.get('learning_plan', []))} step learning sequence"
-            )
-            
-            return analysis
-        except:
-            return {"error": "Analysis failed", "raw_response": response.text}
-    
-    def translate_and_explain(self, content: str, analysis: Dict[str, Any]) -> str:
-        """
-        Agent translates and provides culturally-contextualized explanation
-        """
-        prompt = f"""You are an educational AI agent helping students learn in their native language.
 
-Original Content: {content}
-Content Analysis: {json.dumps(analysis)}
-Target Language: {self.native_language}
+_TRANSLATE_TMPL = """You are an educational AI agent helping students learn in their native language.
 
-CRITICAL: Write your ENTIRE response in {self.native_language} ONLY. Do NOT mix English and {self.native_language}. Every word, every sentence must be in {self.native_language}.
+Target Language: {lang}
+
+CRITICAL: Write your ENTIRE response in {lang} ONLY. Do NOT mix English and {lang}. Every word, every sentence must be in {lang}.
 
 Your autonomous task:
-1. Translate the content completely to {self.native_language}
+1. Translate the content completely to {lang}
 2. Add explanations for difficult concepts using local examples
 3. Include cultural context where relevant
 4. Use simple language appropriate for the difficulty level
 5. Add visual/metaphorical descriptions
 
-Write everything in {self.native_language}. Section headings, explanations, examples - everything must be in {self.native_language}.
+Write everything in {lang}. Section headings, explanations, examples - everything must be in {lang}.
+
+Original Content: {content}
+Content Analysis:
+{analysis}
 """
-        
-        response = self.model.generate_content(prompt)
-        return response.text
-    
-    def generate_interactive_quiz(self, content: str, difficulty: str = "easy") -> List[Dict[str, Any]]:
-        """
-        Agent autonomously generates adaptive quiz questions - MCQ only
-        """
-        prompt = f"""Create an interactive multiple choice quiz in {self.native_language} based on this content.
 
-Content: {content}
-Difficulty: {difficulty}
+_QUIZ_TMPL = """Create an interactive multiple choice quiz in {lang} based on the content below.
 
 Generate 5 multiple choice questions with 4 options each.
 
 For each question, provide:
-- Question in {self.native_language}
+- Question in {lang}
 - Four options (A, B, C, D)
 - Correct answer (A, B, C, or D)
-- Explanation in {self.native_language}
+- Explanation in {lang}
 
 Make questions progressively challenging and test different aspects of understanding.
 
@@ -139,101 +224,58 @@ Return as JSON array:
         "explanation": "..."
     }}
 ]
+
+Difficulty: {difficulty}
+Content: {content}
 """
-        
-        response = self.model.generate_content(prompt)
-        try:
-            quiz = json.loads(response.text.strip().replace("```json", "").replace("```", ""))
-            return quiz
-        except:
-            return []
-    
-    def clarify_doubt(self, question: str, context: str) -> str:
-        """
-        Agent handles doubt clarification with conversational intelligence
-        """
-        prompt = f"""You are a patient tutor helping a student who is learning in {self.native_language}.
 
-Context: {context}
-Student's Question: {question}
-Student Profile: {json.dumps(self.student_profile)}
+_DOUBT_TMPL = """You are a patient tutor helping a student who is learning in {lang}.
 
 Your autonomous response should:
 1. Understand the core confusion
-2. Provide a clear explanation in {self.native_language}
+2. Provide a clear explanation in {lang}
 3. Use analogies from daily life
 4. Break down complex ideas into simple steps
 5. Ask follow-up questions to ensure understanding
 6. Suggest related practice exercises
 
-Respond conversationally in {self.native_language}.
+Respond conversationally in {lang}.
+
+Student Profile: {profile}
+Context: {context}
+Student's Question: {question}
 """
-        
-        response = self.model.generate_content(prompt)
-        self.conversation_history.append({
-            "question": question,
-            "answer": response.text
-        })
-        return response.text
-    
-    def analyze_multimodal_input(self, image_data=None, text: str = "", audio_transcript: str = "") -> str:
-        """
-        Agent processes multimodal input (image + text + audio) and provides comprehensive explanation
-        """
-        if image_data:
-            # For image analysis - native language only
-            prompt = f"""You are an educational AI assistant. Analyze this educational image and explain it COMPLETELY and ONLY in {self.native_language}.
 
-Additional Context: {text}
+# Pre-split at every language slot: lang.join(parts) fills them all in one pass, then the context is appended
+_IMAGE_PROMPT_PARTS = tuple("""You are an educational AI assistant. Analyze this educational image and explain it COMPLETELY and ONLY in {lang}.
 
-CRITICAL INSTRUCTION: Your ENTIRE response must be ONLY in {self.native_language}. Do NOT use ANY English words. NO English headings, NO English structure, NO English at all. Everything - headings, subheadings, explanations, examples - must be in {self.native_language}.
+CRITICAL INSTRUCTION: Your ENTIRE response must be ONLY in {lang}. Do NOT use ANY English words. NO English headings, NO English structure, NO English at all. Everything - headings, subheadings, explanations, examples - must be in {lang}.
 
-Your task (all in {self.native_language}):
+Your task (all in {lang}):
 1. Describe what you see in the image
 2. Explain the educational concept in detail
-3. Translate English text from the image to {self.native_language}
+3. Translate English text from the image to {lang}
 4. Provide real-world examples
 5. Memory tips
 
-Write in simple, clear {self.native_language} that students can easily understand. DO NOT mix with English. Every single word must be in {self.native_language}.
-"""
-            
-            response = self.model.generate_content([prompt, image_data])
-            return response.text
-        else:
-            combined_input = f"{text} {audio_transcript}"
-            analysis = self.analyze_content(combined_input)
-            return self.translate_and_explain(combined_input, analysis)
-    
-    def generate_practice_exercises(self, topic: str, difficulty: str) -> List[str]:
-        """
-        Agent creates personalized practice exercises
-        """
-        prompt = f"""Create 5 practice exercises for:
-Topic: {topic}
-Difficulty: {difficulty}
-Language: {self.native_language}
+Write in simple, clear {lang} that students can easily understand. DO NOT mix with English. Every single word must be in {lang}.
+
+Additional Context: """.split("{lang}"))
+
+_EXERCISES_TMPL = """Create 5 practice exercises in {lang}.
 
 Exercises should be:
 1. Progressively challenging
 2. Real-world applicable
-3. Explained in simple {self.native_language}
+3. Explained in simple {lang}
 
 Format as a numbered list with detailed instructions.
+
+Topic: {topic}
+Difficulty: {difficulty}
 """
-        
-        response = self.model.generate_content(prompt)
-        return response.text.split("\n")
-    
-    def adaptive_learning_path(self, student_response: str, correct_answer: str) -> Dict[str, Any]:
-        """
-        Agent adapts learning path based on student performance
-        """
-        prompt = f"""Analyze student's performance and adapt the learning path.
 
-Student Response: {student_response}
-Correct Answer: {correct_answer}
-Student Profile: {json.dumps(self.student_profile)}
+_ADAPT_TMPL = """Analyze student's performance and adapt the learning path.
 
 Determine:
 1. Is the answer correct?
@@ -250,11 +292,358 @@ Respond in JSON:
     "recommended_difficulty": "beginner/intermediate/advanced",
     "additional_topics": ["topic1", "topic2"]
 }}
+
+Student Profile: {profile}
+Student Response: {student_response}
+Correct Answer: {correct_answer}
+"""
+
+_NEXT_TOPIC_TMPL = """Based on the student's learning profile and current topic, suggest the next logical topic to study.
+
+Suggest the next topic that:
+1. Builds on current knowledge
+2. Addresses weak areas if any
+3. Matches current difficulty level
+4. Maintains engagement
+
+Respond with just the topic name in {lang}.
+
+Current Topic: {current_topic}
+Student Level: {level}
+Topics Covered: {topics_covered}
+Weak Areas: {weak_areas}
+"""
+
+_SUMMARY_TMPL = """Create a structured summary in {lang} of the content below.
+
+Include:
+1. मुख्य बिंदु (Key Points) - bullet points
+2. याद रखने की ट्रिक्स (Memory Tips)
+3. व्यावहारिक उदाहरण (Practical Examples)
+4. अगले कदम (Next Steps)
+
+Make it visually structured with emojis and formatting.
+
+Content: {content}
 """
+
+
+# Strategic planning rules for decide_next_action: (predicate(topics_count, weak_areas_count, quiz_score), decision template)
+_DECISION_RULES = [
+    (lambda topics, weak, score: topics == 0, {
+        "action": "start_learning",
+        "reasoning": "No topics covered yet. Student needs to begin learning journey.",
+        "priority": "high",
+        "suggested_content": "Start with fundamental concepts"
+    }),
+    (lambda topics, weak, score: weak > 2, {
+        "action": "review_weak_areas",
+        "reasoning": "Student has {weak_areas_count} weak areas. Consolidation needed before advancing.",
+        "priority": "high",
+        "suggested_content": "Review: {weak_areas}"
+    }),
+    (lambda topics, weak, score: topics >= 3 and weak <= 1, {
+        "action": "advance_difficulty",
+        "reasoning": "Strong performance across topics. Ready for more challenging content.",
+        "priority": "medium",
+        "suggested_content": "Advance from {difficulty} to next level"
+    }),
+    (lambda topics, weak, score: score < 60, {
+        "action": "provide_detailed_explanation",
+        "reasoning": "Quiz score below 60%. Deeper explanation with examples needed.",
+        "priority": "high",
+        "suggested_content": "Break down concepts with visual aids"
+    }),
+    (lambda topics, weak, score: True, {
+        "action": "continue_learning",
+        "reasoning": "Steady progress. Continue with current learning path.",
+        "priority": "medium",
+        "suggested_content": "Explore related topics or practice more"
+    })
+]
+
+
+class EducationAgent:
+    """
+    Autonomous AI agent that:
+    1. Analyzes student's learning context and needs
+    2. Plans personalized learning path
+    3. Executes multi-step learning strategies
+    4. Adapts based on student responses
+    """
+    
+    MODEL_NAME = 'gemini-2.0-flash-exp'
+    _MODELS: Dict[Tuple[str, str], genai.GenerativeModel] = {}  # (api_key, model name) -> handle shared by agents using that key
+    # Next-topic suggestions keyed by (language, level, current topic, weak areas), shared across students
+    _PLAN_CACHE: Dict[Tuple[str, str, str, Tuple[str, ...]], str] = {}
+    
+    def __init__(self, api_key: str, native_language: str = "Hindi", response_cache: Optional[Dict[str, str]] = None):
+        model_key = (api_key, self.MODEL_NAME)
+        self.model = EducationAgent._MODELS.get(model_key)
+        if self.model is None:
+            if len(EducationAgent._MODELS) >= _MODELS_MAX_ENTRIES:
+                # Evict the oldest key (e.g. a mistyped one); agents already holding it keep working
+                EducationAgent._MODELS.pop(next(iter(EducationAgent._MODELS)), None)
+            self.model = EducationAgent._MODELS.setdefault(
+                model_key, _run_sync(_abind_model(api_key, self.MODEL_NAME))
+            )
+        self.native_language = native_language
+        self.conversation_history = deque(maxlen=_HISTORY_MAX_ENTRIES)
+        self.decision_log = deque(maxlen=_DECISION_LOG_MAX_ENTRIES)  # Track agent's autonomous decisions
+        self._decision_seq = 0  # Total decisions made; the log itself only keeps the latest ones
+        self.state = StudentState(language=native_language)
+        # Response text keyed by (method, language, prompt) hash; may be shared between agents
+        self._cache: Dict[str, str] = {} if response_cache is None else response_cache
+        # O(1) membership for the profile's list fields; the lists keep insertion order
+        self._profile_members: Dict[str, set] = {
+            "topics_covered": set(),
+            "weak_areas": set(),
+            "strengths": set()
+        }
+        self._profile_json_cache = ""
+        self._profile_json_dirty = True  # Set whenever the student state changes
+    
+    @property
+    def student_profile(self) -> Dict[str, Any]:
+        """Snapshot of the student state as a dict; change it via update_profile/add_to_profile"""
+        return self.state.to_dict()
+    
+    def log_decision(self, decision_type: str, reasoning: str, action: str):
+        """Log agent's autonomous decisions for transparency"""
+        self._decision_seq += 1
+        self.decision_log.append({
+            "type": decision_type,
+            "reasoning": reasoning,
+            "action": action,
+            "timestamp": self._decision_seq
+        })
+    
+    def update_profile(self, key: str, value: Any):
+        """Update a student profile field"""
+        setattr(self.state, key, value)
+        if key in self._profile_members:
+            self._profile_members[key] = set(value)
+        self._profile_json_dirty = True
+    
+    def add_to_profile(self, key: str, item: str):
+        """Append an item to a profile list field (topics_covered, weak_areas, strengths), skipping duplicates"""
+        members = self._profile_members[key]
+        if item not in members:
+            members.add(item)
+            getattr(self.state, key).append(item)
+            self._profile_json_dirty = True
+    
+    @property
+    def _profile_json(self) -> str:
+        """Serialized student profile for prompts, rebuilt only after the profile changes"""
+        if self._profile_json_dirty:
+            self._profile_json_cache = orjson.dumps(self.state).decode()
+            self._profile_json_dirty = False
+        return self._profile_json_cache
+    
+    def _cache_key(self, method: str, prompt: str) -> str:
+        """Build the response cache key for a method/prompt pair"""
+        # Separators keep e.g. ("ab", "c") and ("a", "bc") apart; 128 bits is plenty for a per-agent cache
+        return hashlib.blake2b(f"{method}|{self.native_language}|{prompt}".encode(), digest_size=16).hexdigest()
+    
+    async def _generate_cached(self, method: str, prompt: str, generation_config=None) -> str:
+        """Return the model's response text, reusing a cached answer for an identical prompt"""
+        key = self._cache_key(method, prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+        if len(self._cache) >= _CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)), None)  # Evict the oldest entry
+        self._cache[key] = response.text
+        return response.text
         
-        response = self.model.generate_content(prompt)
+    async def aanalyze_content(self, content: str, content_type: str = "text") -> Dict[str, Any]:
+        """
+        Agent autonomously analyzes content and decides learning strategy
+        """
+        prompt = _ANALYZE_TMPL.format(content_type=content_type, content=content)
+        
+        text = await self._generate_cached("analyze_content", prompt, _ANALYSIS_CFG)
         try:
-            adaptation = json.loads(response.text.strip().replace("```json", "").replace("```", ""))
+            analysis = orjson.loads(text)
+            
+            # Log agent's autonomous decision
+            self.log_decision(
+                decision_type="Content Analysis",
+                reasoning=f"Identified as {analysis.get('difficulty_level', 'unknown')} level topic requiring {analysis.get('teaching_strategy', 'standard')} approach",
+                action=f"Planning {len(analysis.get('learning_plan', []))} step learning sequence"
+            )
+            
+            return analysis
+        except (orjson.JSONDecodeError, AttributeError):  # AttributeError: valid JSON but not an object
+            # Don't keep serving an unparseable response
+            self._cache.pop(self._cache_key("analyze_content", prompt), None)
+            return {"error": "Analysis failed", "raw_response": text}
+
+    def analyze_content(self, content: str, content_type: str = "text") -> Dict[str, Any]:
+        """Synchronous wrapper around aanalyze_content"""
+        return _run_sync(self.aanalyze_content(content, content_type))
+
+    async def atranslate_and_explain(self, content: str, analysis: Dict[str, Any]) -> str:
+        """
+        Agent translates and provides culturally-contextualized explanation
+        """
+        prompt = _TRANSLATE_TMPL.format(
+            lang=self.native_language,
+            content=content,
+            analysis=_kv(analysis)
+        )
+        
+        response = await self.model.generate_content_async(prompt)
+        return response.text
+
+    def translate_and_explain(self, content: str, analysis: Dict[str, Any]) -> str:
+        """Synchronous wrapper around atranslate_and_explain"""
+        return _run_sync(self.atranslate_and_explain(content, analysis))
+
+    async def atranslate_and_explain_stream(self, content: str, analysis: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Same explanation as atranslate_and_explain, yielded chunk by chunk as the model writes it
+        """
+        prompt = _TRANSLATE_TMPL.format(
+            lang=self.native_language,
+            content=content,
+            analysis=_kv(analysis)
+        )
+        
+        response = await self.model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            yield chunk.text
+
+    def translate_and_explain_stream(self, content: str, analysis: Dict[str, Any]) -> Iterator[str]:
+        """Synchronous generator wrapper around atranslate_and_explain_stream (e.g. for st.write_stream)"""
+        return _iter_sync(self.atranslate_and_explain_stream(content, analysis))
+
+    async def agenerate_interactive_quiz(self, content: str, difficulty: str = "easy") -> List[Dict[str, Any]]:
+        """
+        Agent autonomously generates adaptive quiz questions - MCQ only
+        """
+        prompt = _QUIZ_TMPL.format(lang=self.native_language, difficulty=difficulty, content=content)
+        
+        # Not cached: every "Generate Quiz" press should produce a fresh set of questions
+        response = await self.model.generate_content_async(prompt, generation_config=_QUIZ_CFG)
+        try:
+            quiz = orjson.loads(response.text)
+            if not isinstance(quiz, list):
+                raise orjson.JSONDecodeError("Expected a JSON array of questions", response.text, 0)
+            return quiz
+        except orjson.JSONDecodeError:
+            return []
+
+    def generate_interactive_quiz(self, content: str, difficulty: str = "easy") -> List[Dict[str, Any]]:
+        """Synchronous wrapper around agenerate_interactive_quiz"""
+        return _run_sync(self.agenerate_interactive_quiz(content, difficulty))
+
+    async def aclarify_doubt(self, question: str, context: str) -> str:
+        """
+        Agent handles doubt clarification with conversational intelligence
+        """
+        prompt = self._doubt_prompt(question, context)
+        
+        response = await self.model.generate_content_async(prompt)
+        self.conversation_history.append({
+            "question": question,
+            "answer": response.text
+        })
+        return response.text
+
+    def clarify_doubt(self, question: str, context: str) -> str:
+        """Synchronous wrapper around aclarify_doubt"""
+        return _run_sync(self.aclarify_doubt(question, context))
+
+    async def abatch_clarify_doubts(self, questions: List[Tuple[str, str]]) -> List[str]:
+        """
+        Agent clarifies several (question, context) doubts at once with concurrent LLM calls
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        
+        async def answer(question: str, context: str):
+            async with semaphore:
+                return await self.model.generate_content_async(self._doubt_prompt(question, context))
+        
+        results = await asyncio.gather(
+            *(answer(question, context) for question, context in questions),
+            return_exceptions=True
+        )
+        
+        # Keep the answers in question order; failed calls are reported but not added to history
+        answers = []
+        for (question, _), result in zip(questions, results):
+            if isinstance(result, BaseException):
+                answers.append(f"Error: {result}")
+                continue
+            self.conversation_history.append({
+                "question": question,
+                "answer": result.text
+            })
+            answers.append(result.text)
+        return answers
+
+    def batch_clarify_doubts(self, questions: List[Tuple[str, str]]) -> List[str]:
+        """Synchronous wrapper around abatch_clarify_doubts"""
+        return _run_sync(self.abatch_clarify_doubts(questions))
+
+    def _doubt_prompt(self, question: str, context: str) -> str:
+        """Build the doubt clarification prompt for one question"""
+        return _DOUBT_TMPL.format(
+            lang=self.native_language,
+            profile=self._profile_json,
+            context=context,
+            question=question
+        )
+
+    async def aanalyze_multimodal_input(self, image_data=None, text: str = "", audio_transcript: str = "") -> str:
+        """
+        Agent processes multimodal input (image + text + audio) and provides comprehensive explanation
+        """
+        if image_data:
+            # For image analysis - native language only
+            prompt = "".join((self.native_language.join(_IMAGE_PROMPT_PARTS), text, "\n"))
+            
+            response = await self.model.generate_content_async([prompt, image_data])
+            return response.text
+        else:
+            combined_input = f"{text} {audio_transcript}"
+            analysis = await self.aanalyze_content(combined_input)
+            return await self.atranslate_and_explain(combined_input, analysis)
+
+    def analyze_multimodal_input(self, image_data=None, text: str = "", audio_transcript: str = "") -> str:
+        """Synchronous wrapper around aanalyze_multimodal_input"""
+        return _run_sync(self.aanalyze_multimodal_input(image_data, text, audio_transcript))
+
+    async def agenerate_practice_exercises(self, topic: str, difficulty: str) -> List[str]:
+        """
+        Agent creates personalized practice exercises
+        """
+        prompt = _EXERCISES_TMPL.format(lang=self.native_language, topic=topic, difficulty=difficulty)
+        
+        text = await self._generate_cached("generate_practice_exercises", prompt)
+        return [line for line in text.splitlines() if line.strip()]
+
+    def generate_practice_exercises(self, topic: str, difficulty: str) -> List[str]:
+        """Synchronous wrapper around agenerate_practice_exercises"""
+        return _run_sync(self.agenerate_practice_exercises(topic, difficulty))
+
+    async def aadaptive_learning_path(self, student_response: str, correct_answer: str) -> Dict[str, Any]:
+        """
+        Agent adapts learning path based on student performance
+        """
+        prompt = _ADAPT_TMPL.format(
+            profile=self._profile_json,
+            student_response=student_response,
+            correct_answer=correct_answer
+        )
+        
+        response = await self.model.generate_content_async(prompt, generation_config=_ADAPTATION_CFG)
+        try:
+            adaptation = orjson.loads(response.text)
             
             # Log adaptive decision
             self.log_decision(
@@ -264,71 +653,46 @@ Respond in JSON:
             )
             
             # Update student profile
-            old_level = self.student_profile["difficulty_level"]
-            new_level = adaptation.get("recommended_difficulty", old_level)
-            self.student_profile["difficulty_level"] = new_level
+            new_level = adaptation.get("recommended_difficulty", self.state.difficulty_level)
+            self.update_profile("difficulty_level", new_level)
             
             # Track progress
-            if adaptation.get("is_correct"):
-                if "strengths" not in self.student_profile:
-                    self.student_profile["strengths"] = []
-                # Don't add duplicates
-            else:
-                if adaptation.get("misconception"):
-                    if adaptation["misconception"] not in self.student_profile["weak_areas"]:
-                        self.student_profile["weak_areas"].append(adaptation["misconception"])
+            if not adaptation.get("is_correct") and adaptation.get("misconception"):
+                self.add_to_profile("weak_areas", adaptation["misconception"])
             
             return adaptation
-        except:
+        except (orjson.JSONDecodeError, AttributeError):  # AttributeError: valid JSON but not an object
             return {"error": "Adaptation failed"}
-    
+
+    def adaptive_learning_path(self, student_response: str, correct_answer: str) -> Dict[str, Any]:
+        """Synchronous wrapper around aadaptive_learning_path"""
+        return _run_sync(self.aadaptive_learning_path(student_response, correct_answer))
+
     def decide_next_action(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Agent autonomously decides what action to take next based on student state
         """
         # Analyze student's current state
-        topics_count = len(self.student_profile.get("topics_covered", []))
-        weak_areas_count = len(self.student_profile.get("weak_areas", []))
-        difficulty = self.student_profile.get("difficulty_level", "beginner")
+        state = self.state
+        topics_count = len(state.topics_covered)
+        weak_areas = state.weak_areas
+        difficulty = state.difficulty_level
+        quiz_score = context.get("quiz_score", 0)
         
+        # Decision logic - Agent thinks autonomously (first matching rule wins)
+        template = next(
+            template for rule, template in _DECISION_RULES
+            if rule(topics_count, len(weak_areas), quiz_score)
+        )
         decision = {
-            "action": "",
-            "reasoning": "",
-            "priority": "",
-            "suggested_content": ""
+            key: value.format(
+                weak_areas_count=len(weak_areas),
+                weak_areas=', '.join(weak_areas[:3]),
+                difficulty=difficulty
+            )
+            for key, value in template.items()
         }
         
-        # Decision logic - Agent thinks autonomously
-        if topics_count == 0:
-            decision["action"] = "start_learning"
-            decision["reasoning"] = "No topics covered yet. Student needs to begin learning journey."
-            decision["priority"] = "high"
-            decision["suggested_content"] = "Start with fundamental concepts"
-            
-        elif weak_areas_count > 2:
-            decision["action"] = "review_weak_areas"
-            decision["reasoning"] = f"Student has {weak_areas_count} weak areas. Consolidation needed before advancing."
-            decision["priority"] = "high"
-            decision["suggested_content"] = f"Review: {', '.join(self.student_profile['weak_areas'][:3])}"
-            
-        elif topics_count >= 3 and weak_areas_count <= 1:
-            decision["action"] = "advance_difficulty"
-            decision["reasoning"] = "Strong performance across topics. Ready for more challenging content."
-            decision["priority"] = "medium"
-            decision["suggested_content"] = f"Advance from {difficulty} to next level"
-            
-        elif context.get("quiz_score", 0) < 60:
-            decision["action"] = "provide_detailed_explanation"
-            decision["reasoning"] = "Quiz score below 60%. Deeper explanation with examples needed."
-            decision["priority"] = "high"
-            decision["suggested_content"] = "Break down concepts with visual aids"
-            
-        else:
-            decision["action"] = "continue_learning"
-            decision["reasoning"] = "Steady progress. Continue with current learning path."
-            decision["priority"] = "medium"
-            decision["suggested_content"] = "Explore related topics or practice more"
-        
         # Log this autonomous decision
         self.log_decision(
             decision_type="Strategic Planning",
@@ -338,29 +702,40 @@ Respond in JSON:
         
         return decision
     
-    def suggest_next_topic(self, current_topic: str) -> str:
+    async def asuggest_next_topic(self, current_topic: str) -> str:
         """
         Agent proactively suggests next topic based on learning progression
         """
-        prompt = f"""Based on the student's learning profile and current topic, suggest the next logical topic to study.
-
-Current Topic: {current_topic}
-Student Level: {self.student_profile['difficulty_level']}
-Topics Covered: {', '.join(self.student_profile.get('topics_covered', []))}
-Weak Areas: {', '.join(self.student_profile.get('weak_areas', []))}
-
-Suggest the next topic that:
-1. Builds on current knowledge
-2. Addresses weak areas if any
-3. Matches current difficulty level
-4. Maintains engagement
-
-Respond with just the topic name in {self.native_language}.
-"""
+        plan_key = (
+            self.native_language,
+            self.state.difficulty_level,
+            current_topic,
+            tuple(sorted(self.state.weak_areas)[:3])
+        )
+        suggestion = EducationAgent._PLAN_CACHE.get(plan_key)
+        if suggestion is not None:
+            self.log_decision(
+                decision_type="Proactive Suggestion",
+                reasoning="Same learning state seen before - served from plan cache",
+                action=f"Recommending: {suggestion}"
+            )
+            return suggestion
+        
+        prompt = _NEXT_TOPIC_TMPL.format(
+            lang=self.native_language,
+            current_topic=current_topic,
+            level=self.state.difficulty_level,
+            topics_covered=', '.join(self.state.topics_covered),
+            weak_areas=', '.join(self.state.weak_areas)
+        )
         
-        response = self.model.generate_content(prompt)
+        response = await self.model.generate_content_async(prompt)
         suggestion = response.text.strip()
         
+        if len(EducationAgent._PLAN_CACHE) >= _PLAN_CACHE_MAX_ENTRIES:
+            EducationAgent._PLAN_CACHE.pop(next(iter(EducationAgent._PLAN_CACHE)), None)
+        EducationAgent._PLAN_CACHE[plan_key] = suggestion
+        
         self.log_decision(
             decision_type="Proactive Suggestion",
             reasoning=f"Based on current progress, suggesting related topic",
@@ -369,23 +744,83 @@ Respond with just the topic name in {self.native_language}.
         
         return suggestion
 
-    
-    def generate_summary(self, content: str) -> str:
+    def suggest_next_topic(self, current_topic: str) -> str:
+        """Synchronous wrapper around asuggest_next_topic"""
+        return _run_sync(self.asuggest_next_topic(current_topic))
+
+    async def agenerate_summary(self, content: str) -> str:
         """
         Agent creates a visual summary with key takeaways
         """
-        prompt = f"""Create a structured summary in {self.native_language}:
+        prompt = _SUMMARY_TMPL.format(lang=self.native_language, content=content)
+        
+        return await self._generate_cached("generate_summary", prompt)
 
-Content: {content}
+    def generate_summary(self, content: str) -> str:
+        """Synchronous wrapper around agenerate_summary"""
+        return _run_sync(self.agenerate_summary(content))
 
-Include:
-1. मुख्य बिंदु (Key Points) - bullet points
-2. याद रखने की ट्रिक्स (Memory Tips)
-3. व्यावहारिक उदाहरण (Practical Examples)
-4. अगले कदम (Next Steps)
+    async def abuild_lesson(self, content: str, difficulty: str = "easy") -> Dict[str, Any]:
+        """
+        Agent builds a full lesson: analysis first, then quiz, exercises and summary concurrently
+        """
+        analysis = await self.aanalyze_content(content)
+        
+        # Quiz, exercises and summary only depend on the content/analysis, not on each other
+        quiz, exercises, summary = await asyncio.gather(
+            self.agenerate_interactive_quiz(content, difficulty),
+            self.agenerate_practice_exercises(
+                analysis.get("main_topic", "General"),
+                analysis.get("difficulty_level", self.state.difficulty_level)
+            ),
+            self.agenerate_summary(content)
+        )
+        
+        return {
+            "analysis": analysis,
+            "quiz": quiz,
+            "exercises": exercises,
+            "summary": summary
+        }
 
-Make it visually structured with emojis and formatting.
-"""
+    def build_lesson(self, content: str, difficulty: str = "easy") -> Dict[str, Any]:
+        """Synchronous wrapper around abuild_lesson"""
+        return _run_sync(self.abuild_lesson(content, difficulty))
+
+    async def _lesson_extras(self, content: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the summary and next-topic suggestion that accompany a lesson"""
+        main_topic = analysis.get("main_topic")
+        if not main_topic:
+            return {"summary": await self.agenerate_summary(content), "next_topic": None}
         
-        response = self.model.generate_content(prompt)
-        return response.text
+        summary, next_topic = await asyncio.gather(
+            self.agenerate_summary(content),
+            self.asuggest_next_topic(main_topic)
+        )
+        return {"summary": summary, "next_topic": next_topic}
+
+    def start_lesson_extras(self, content: str, analysis: Dict[str, Any]) -> Future:
+        """
+        Agent starts the lesson summary and next-topic suggestion in the background, so they are
+        generated while the explanation streams; .result() gives {"summary", "next_topic"}
+        """
+        return asyncio.run_coroutine_threadsafe(self._lesson_extras(content, analysis), _get_loop())
+
+    async def _post_quiz_materials(self, content: str, topic: str, difficulty: str) -> Dict[str, Any]:
+        """Generate the summary and practice exercises shown after a quiz"""
+        summary, exercises = await asyncio.gather(
+            self.agenerate_summary(content),
+            self.agenerate_practice_exercises(topic, difficulty)
+        )
+        return {"summary": summary, "exercises": exercises}
+
+    def prefetch_post_quiz(self, content: str, topic: str, difficulty: str) -> Future:
+        """
+        Agent speculatively prepares the post-quiz summary and exercises while the student answers.
+        Both land in the response cache, so later generate_summary/generate_practice_exercises calls
+        are instant; call .result() to wait for them or .cancel() if the student moves on.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._post_quiz_materials(content, topic, difficulty),
+            _get_loop()
+        )
@@ -9,22 +9,15 @@ from dotenv import load_dotenv
 from PIL import Image
 import io
 import base64
+import hashlib
+from collections import deque
 from agent import EducationAgent
-import pypdf
+from pdf_text import extract_pdf_text
+from itertools import islice
+from typing import Final
 
-# Load environment variables
-load_dotenv()
-
-# Page configuration
-st.set_page_config(
-    page_title="Education Language Bridge 🌉",
-    page_icon="🎓",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS
-st.markdown("""
+# Static HTML/CSS blocks rendered by the UI
+CUSTOM_CSS: Final[str] = """
 <style>
     .main-header {
         text-align: center;
@@ -56,57 +49,637 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
-
-# Initialize session state
-if 'agent' not in st.session_state:
-    st.session_state.agent = None
-if 'current_content' not in st.session_state:
-    st.session_state.current_content = ""
-if 'analysis' not in st.session_state:
-    st.session_state.analysis = None
-if 'quiz' not in st.session_state:
-    st.session_state.quiz = []
-if 'quiz_answers' not in st.session_state:
-    st.session_state.quiz_answers = {}
-if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
-if 'quiz_submitted' not in st.session_state:
-    st.session_state.quiz_submitted = False
-if 'quiz_scores' not in st.session_state:
-    st.session_state.quiz_scores = []
-if 'topics_learned' not in st.session_state:
-    st.session_state.topics_learned = []
+"""
+
+HEADER_HTML: Final[str] = """
+<div class="main-header">
+    <h1>🌉 Education Language Bridge</h1>
+    <p>AI-Powered Multimodal Learning Assistant with True Agentic Behavior</p>
+</div>
+"""
+
+FEATURE_BOX_AGENTIC: Final[str] = """
+<div class="feature-box">
+    <h3>🎯 Agentic Behavior</h3>
+    <p>AI autonomously plans learning paths, adapts difficulty, and provides personalized explanations</p>
+</div>
+"""
+
+FEATURE_BOX_MULTIMODAL: Final[str] = """
+<div class="feature-box">
+    <h3>🌍 Multimodal Input</h3>
+    <p>Process images, PDFs, text, and audio for comprehensive learning</p>
+</div>
+"""
+
+FEATURE_BOX_NATIVE: Final[str] = """
+<div class="feature-box">
+    <h3>🗣️ Native Language</h3>
+    <p>Learn complex topics in your mother tongue with cultural context</p>
+</div>
+"""
+
+FEATURE_BOX_WHAT_IS_AGENTIC: Final[str] = """
+<div class="feature-box">
+    <h3>🎯 What is Agentic Behavior?</h3>
+    <p>This AI agent demonstrates <strong>true autonomy</strong> by making decisions, planning learning paths, 
+    and adapting strategies without explicit instructions. Watch how it thinks and acts independently!</p>
+</div>
+"""
+
+CAPABILITIES_LEFT_MD: Final[str] = """
+**✅ Planning & Strategy:**
+- Analyzes content difficulty autonomously
+- Creates multi-step learning sequences
+- Plans personalized teaching approaches
+
+**✅ Adaptation & Learning:**
+- Adjusts difficulty based on performance
+- Identifies misconceptions automatically
+- Updates teaching strategy in real-time
+"""
+
+CAPABILITIES_RIGHT_MD: Final[str] = """
+**✅ Proactive Behavior:**
+- Suggests next topics without prompting
+- Recommends learning actions strategically
+- Detects when review is needed
+
+**✅ Contextual Understanding:**
+- Maintains student learning history
+- Tracks strengths and weaknesses
+- Adapts to cultural context
+"""
+
+TRADITIONAL_AI_HTML: Final[str] = """
+<div style="flex: 1 1 16rem; background-color: #f8f9fa; padding: 1rem; border-radius: 8px;">
+    <h4>🔹 Traditional AI</h4>
+    <ul>
+        <li>Waits for user commands</li>
+        <li>Provides static responses</li>
+        <li>No memory or adaptation</li>
+        <li>One-size-fits-all approach</li>
+        <li>Reactive only</li>
+    </ul>
+</div>
+"""
+
+AGENTIC_AI_HTML: Final[str] = """
+<div style="flex: 1 1 16rem; background-color: #d4edda; padding: 1rem; border-radius: 8px;">
+    <h4>🌟 Our Agentic AI</h4>
+    <ul>
+        <li><strong>Autonomous decision-making</strong></li>
+        <li><strong>Dynamic adaptation</strong></li>
+        <li><strong>Persistent memory & learning</strong></li>
+        <li><strong>Personalized strategies</strong></li>
+        <li><strong>Proactive & Reactive</strong></li>
+    </ul>
+</div>
+"""
+
+# Divider, heading and both cards (side by side, wrapping on narrow screens) in one element.
+# Joined without blank lines, which would end the HTML block in Streamlit's markdown parser
+COMPARISON_HTML: Final[str] = "\n".join((
+    '<hr style="margin: 1rem 0; border: 0; border-top: 1px solid #eee;">',
+    '<h3>📊 Traditional AI vs Agentic AI</h3>',
+    '<div style="display: flex; flex-wrap: wrap; gap: 1rem;">',
+    TRADITIONAL_AI_HTML.strip(),
+    AGENTIC_AI_HTML.strip(),
+    '</div>'
+))
+
+AGENT_THINKING_LEARN: Final[str] = """
+<div class="agent-thinking">
+    <h4>🤖 Agent Thinking Process:</h4>
+    <p>1. Analyzing content complexity and key concepts...</p>
+    <p>2. Planning optimal learning sequence...</p>
+    <p>3. Generating culturally-contextualized explanations...</p>
+    <p>4. Preparing interactive elements...</p>
+</div>
+"""
+
+AGENT_THINKING_VISION: Final[str] = """
+<div class="agent-thinking">
+    <h4>🤖 Agent Vision Process:</h4>
+    <p>1. Detecting visual elements and text...</p>
+    <p>2. Understanding educational context...</p>
+    <p>3. Generating native language explanation...</p>
+</div>
+"""
+
+LESSON_READY_HTML: Final[str] = """
+<div class="success-box">
+    ✅ Learning material prepared! Check the Practice Quiz tab for exercises.
+</div>
+"""
+
+STRATEGIC_DECISION_HTML: Final[str] = """
+<div class="agent-thinking">
+    <h4>🤖 Agent's Autonomous Decision:</h4>
+    <p><strong>Recommended Action:</strong> {action}</p>
+    <p><strong>Priority:</strong> {priority}</p>
+    <p><strong>Agent's Reasoning:</strong> {reasoning}</p>
+    <p><strong>Suggestion:</strong> {suggestion}</p>
+</div>
+"""
+
+SIDEBAR_DECISION_MD: Final[str] = """
+**{type}**  
+💭 Reasoning: {reasoning}  
+⚡ Action: {action}
+"""
+
+SIDEBAR_FEATURES_MD: Final[str] = """
+- 🖼️ Image Analysis
+- 📄 PDF Processing
+- 💬 Doubt Clarification
+- 📝 Quiz Generation
+- 🎯 Adaptive Learning
+- 🔄 Real-time Translation
+- 📊 Progress Tracking
+"""
+
+# Quiz feedback box, indexed by "score >= 80"
+_FEEDBACK_BOX: Final[str] = """
+<div class="{box_class}">
+    <h4>🤖 Agent's Analysis:</h4>
+    <p><strong>Performance:</strong> {{feedback}}</p>
+    <p><strong>Next Step:</strong> {{next_step}}</p>
+    <p><strong>Recommended Level:</strong> {{level}}</p>
+</div>
+"""
+BOX_TEMPLATES: Final[tuple] = (
+    _FEEDBACK_BOX.format(box_class="agent-thinking"),
+    _FEEDBACK_BOX.format(box_class="success-box")
+)
+
+DECISION_ENTRY_MD: Final[str] = """#### Decision #{timestamp}: {type}
+**Type:** {type} · **Step:** {timestamp}
+
+**💭 Agent's Reasoning:** {reasoning}
+
+**⚡ Action Taken:** {action}
+
+---"""
+
+INSIGHTS_PAGE_SIZE: Final[int] = 10  # Decisions shown per page in the Agent Insights tab
+CHAT_HISTORY_MAX: Final[int] = 100  # Chat turns kept on screen per session
+QUIZ_SCORES_MAX: Final[int] = 50  # Quiz results kept in the score history; totals live in quiz_agg
+
+# Load environment variables
+load_dotenv()
+
+# Page configuration
+st.set_page_config(
+    page_title="Education Language Bridge 🌉",
+    page_icon="🎓",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Initialize session state (the literal is rebuilt on every script run, so sessions never share containers)
+_DEFAULTS = {
+    'agent': None,
+    'current_content': "",
+    'analysis': None,
+    'quiz': [],
+    'quiz_answers': {},
+    'chat_history': deque(maxlen=CHAT_HISTORY_MAX),
+    'doubts_clarified': 0,
+    'quiz_submitted': False,
+    'quiz_results': [],
+    'quiz_scores': deque(maxlen=QUIZ_SCORES_MAX),
+    'quiz_agg': {'sum_score': 0.0, 'count': 0, 'total_correct': 0, 'total_questions': 0},
+    'topics_learned': {},  # insertion-ordered set: O(1) membership, stable display order
+    'insights_page': 0,
+    'decoded_image': {}  # {digest: PIL image} for the latest upload in the Image tab
+}
+for key, value in _DEFAULTS.items():
+    st.session_state.setdefault(key, value)
+
+@st.cache_resource(show_spinner=False)
+def _get_response_cache(api_key: str, language: str) -> dict:
+    """Process-wide LLM response cache, shared by every session with the same key and language"""
+    return {}
 
 def initialize_agent(api_key: str, language: str):
     """Initialize the AI agent"""
     try:
-        st.session_state.agent = EducationAgent(api_key, language)
+        # The agent itself stays per session (it holds the student's profile and logs);
+        # the model handle and response cache are shared across sessions
+        st.session_state.agent = EducationAgent(
+            api_key,
+            language,
+            response_cache=_get_response_cache(api_key, language)
+        )
         return True
     except Exception as e:
         st.error(f"Failed to initialize agent: {str(e)}")
         return False
 
-def extract_text_from_pdf(pdf_file) -> str:
-    """Extract text from uploaded PDF file"""
+def _file_digest(uploaded) -> str:
+    """Hash an uploaded file in 64 KiB chunks, leaving it rewound for the parser"""
+    h = hashlib.blake2b(digest_size=16)
+    uploaded.seek(0)
+    for chunk in iter(lambda: uploaded.read(65536), b''):
+        h.update(chunk)
+    uploaded.seek(0)
+    return h.hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _extract_pdf_text_cached(digest: str, _pdf_file) -> str:
+    """Parse a PDF to text; cached by content digest (the underscore stops Streamlit hashing the file itself)"""
+    # PyMuPDF only accepts bytes or an exact io.BytesIO, not Streamlit's UploadedFile subclass
+    return extract_pdf_text(_pdf_file.getvalue())
+
+def extract_text_from_pdf(uploaded_file) -> str:
+    """Extract text from an uploaded PDF file"""
     try:
-        pdf_reader = pypdf.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        return _extract_pdf_text_cached(_file_digest(uploaded_file), uploaded_file)
     except Exception as e:
+        # Failures raise out of the cached function, so they aren't cached
         st.error(f"Error extracting PDF text: {str(e)}")
         return ""
 
+def _decode_image(uploaded_image) -> Image.Image:
+    """
+    Decode an uploaded image once per session and content digest instead of on every rerun.
+    Kept in session_state rather than a Streamlit cache: cache_data's pickling would drop the PNG/JPEG
+    file type Gemini's upload relies on, and a process-wide cache_resource would share one Image
+    (which save() mutates) between sessions' threads. Only the latest upload is kept.
+    """
+    digest = _file_digest(uploaded_image)
+    image = st.session_state.decoded_image.get(digest)
+    if image is None:
+        image = Image.open(uploaded_image)
+        image.load()  # Decode now, while the upload is still open
+        st.session_state.decoded_image = {digest: image}
+    return image
+
+@st.fragment
+def chat_fragment():
+    """Doubt chat; reruns only this block on each message"""
+    # History lives in a container created before the input, so a new turn drawn into it
+    # lands above the (inline, in-tab) chat input without a rerun
+    history = st.container()
+    
+    # Display chat history (st attributes bound locally; this loop runs once per stored turn)
+    chat_message, write = history.chat_message, st.write
+    for chat in st.session_state.chat_history:
+        with chat_message("user"):
+            write(chat['question'])
+        with chat_message("assistant"):
+            write(chat['answer'])
+    
+    # Chat input
+    user_question = st.chat_input("Ask your doubt here...")
+    
+    if user_question:
+        # Add to chat
+        with history.chat_message("user"):
+            st.write(user_question)
+        
+        with history.chat_message("assistant"):
+            with st.spinner("🤖 Agent is thinking..."):
+                answer = st.session_state.agent.clarify_doubt(
+                    user_question,
+                    st.session_state.current_content
+                )
+                st.write(answer)
+        
+        # Update history (the new turn is already drawn in place, so no rerun is needed)
+        st.session_state.chat_history.append({
+            'question': user_question,
+            'answer': answer
+        })
+        st.session_state.doubts_clarified += 1
+
+@st.fragment
+def quiz_fragment():
+    """Practice quiz; answer clicks rerun only this block"""
+    if st.session_state.current_content:
+        difficulty = st.select_slider(
+            "Difficulty Level",
+            options=["easy", "medium", "hard"],
+            value="medium"
+        )
+        
+        if st.button("🤖 Agent: Generate Quiz", type="primary"):
+            with st.spinner("📝 Agent is creating personalized quiz..."):
+                quiz = st.session_state.agent.generate_interactive_quiz(
+                    st.session_state.current_content,
+                    difficulty
+                )
+                st.session_state.quiz = quiz
+                st.session_state.quiz_submitted = False  # Reset submission status
+                st.session_state.quiz_results = []
+        
+        if st.session_state.quiz:
+            st.markdown("### 🎯 Your Personalized Quiz")
+            
+            for idx, question in enumerate(st.session_state.quiz):
+                st.markdown(f"#### Question {idx + 1}")
+                st.write(question.get('question', ''))
+                
+                # Only MCQ questions
+                answer = st.radio(
+                    "Select your answer:",
+                    question.get('options', []),
+                    key=f"q_{idx}"
+                )
+                st.session_state.quiz_answers[idx] = answer
+                
+                # Show explanation only after quiz is submitted (graded once, at submit time)
+                if st.session_state.quiz_submitted and idx < len(st.session_state.quiz_results):
+                    result = st.session_state.quiz_results[idx]
+                    
+                    if result['is_correct']:
+                        st.success(f"✅ Correct! {result['explanation']}")
+                    else:
+                        st.error(f"❌ Incorrect. Correct answer: {result['correct_answer']}")
+                        st.info(f"💡 Explanation: {result['explanation']}")
+            
+            if st.button("✅ Submit Quiz"):
+                # Mark quiz as submitted
+                st.session_state.quiz_submitted = True
+                
+                with st.spinner("🤖 Agent is analyzing your performance..."):
+                    # Grade each answer once; the display loop reuses these results on later reruns
+                    results = []
+                    for idx, question in enumerate(st.session_state.quiz):
+                        user_answer = st.session_state.quiz_answers.get(idx, "")
+                        correct_answer = question.get('correct', '')
+                        results.append({
+                            'user_answer': user_answer,
+                            'correct_answer': correct_answer,
+                            'is_correct': str(user_answer).strip().lower() == str(correct_answer).strip().lower(),
+                            'explanation': question.get('explanation', '')
+                        })
+                    st.session_state.quiz_results = results
+                    
+                    # Calculate score
+                    correct_count = sum(result['is_correct'] for result in results)
+                    total_questions = len(results)
+                    
+                    # Calculate percentage
+                    score_percentage = (correct_count / total_questions * 100) if total_questions > 0 else 0
+                    
+                    # Agent adaptive learning
+                    if score_percentage >= 80:
+                        adaptation = {
+                            'next_action': 'move_forward',
+                            'recommended_difficulty': 'advanced' if difficulty == 'hard' else 'hard',
+                            'feedback': 'Excellent! You have mastered this topic.'
+                        }
+                    elif score_percentage >= 60:
+                        adaptation = {
+                            'next_action': 'review',
+                            'recommended_difficulty': difficulty,
+                            'feedback': 'Good progress! Review the concepts and try again.'
+                        }
+                    else:
+                        adaptation = {
+                            'next_action': 'deep_dive',
+                            'recommended_difficulty': 'easy' if difficulty == 'hard' else difficulty,
+                            'feedback': 'Let\'s take it slower. I\'ll explain the concepts in more detail.'
+                        }
+                
+                # Display results
+                st.markdown("---")
+                st.markdown("### 📊 Quiz Results")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Score", f"{correct_count}/{total_questions}")
+                with col2:
+                    st.metric("Percentage", f"{score_percentage:.0f}%")
+                with col3:
+                    if score_percentage >= 80:
+                        st.metric("Grade", "A", delta="Excellent")
+                    elif score_percentage >= 60:
+                        st.metric("Grade", "B", delta="Good")
+                    else:
+                        st.metric("Grade", "C", delta="Needs Improvement")
+                
+                # Agent's feedback
+                st.markdown(BOX_TEMPLATES[score_percentage >= 80].format(
+                    feedback=adaptation['feedback'],
+                    next_step=adaptation['next_action'].replace('_', ' ').title(),
+                    level=adaptation['recommended_difficulty'].title()
+                ), unsafe_allow_html=True)
+                
+                # Detailed breakdown
+                with st.expander("📋 Detailed Answer Review"):
+                    # One markdown block instead of several elements per question
+                    lines = []
+                    for idx, result in enumerate(results):
+                        if result['is_correct']:
+                            lines.append(f"✅ **Q{idx+1}:** Correct!")
+                        else:
+                            lines.append(f"❌ **Q{idx+1}:** Incorrect")
+                            lines.append(f"- Your answer: {result['user_answer']}")
+                            lines.append(f"- Correct answer: {result['correct_answer']}")
+                        lines.append("")
+                    st.markdown("\n".join(lines))
+                
+                if score_percentage >= 80:
+                    st.balloons()
+                
+                # Track quiz score
+                st.session_state.quiz_scores.append({
+                    'score': score_percentage,
+                    'correct': correct_count,
+                    'total': total_questions,
+                    'difficulty': difficulty
+                })
+                # Running totals so the Progress tab doesn't re-reduce the whole history each rerun
+                agg = st.session_state.quiz_agg
+                agg['sum_score'] += score_percentage
+                agg['count'] += 1
+                agg['total_correct'] += correct_count
+                agg['total_questions'] += total_questions
+                
+                # Update student profile
+                st.session_state.agent.update_profile('difficulty_level', adaptation['recommended_difficulty'])
+                
+                # Full rerun so explanations, the sidebar and Progress tab pick up the new results
+                st.rerun()
+    else:
+        st.info("📚 Please learn some content first in the 'Learn Content' tab")
+
+@st.fragment
+def progress_fragment():
+    """Learning progress; reruns only this block"""
+    if st.session_state.agent:
+        profile = st.session_state.agent.student_profile
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Current Level", profile['difficulty_level'].title())
+        
+        with col2:
+            st.metric("Topics Covered", len(st.session_state.topics_learned))
+        
+        with col3:
+            st.metric("Doubts Clarified", st.session_state.doubts_clarified)
+        
+        # Quiz performance
+        if st.session_state.quiz_scores:
+            st.markdown("### 📈 Quiz Performance")
+            
+            agg = st.session_state.quiz_agg
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                avg_score = agg['sum_score'] / agg['count'] if agg['count'] else 0
+                st.metric("Average Score", f"{avg_score:.1f}%")
+            
+            with col2:
+                st.metric("Quizzes Taken", agg['count'])
+            
+            with col3:
+                st.metric("Total Correct", f"{agg['total_correct']}/{agg['total_questions']}")
+            
+            # Score history
+            with st.expander("📊 View Score History"):
+                # Older entries may have been evicted, so number from the running count
+                first_number = agg['count'] - len(st.session_state.quiz_scores) + 1
+                for number, quiz_score in enumerate(st.session_state.quiz_scores, first_number):
+                    st.write(f"**Quiz {number}:** {quiz_score['correct']}/{quiz_score['total']} ({quiz_score['score']:.0f}%) - Difficulty: {quiz_score['difficulty']}")
+        
+        # Topics learned
+        if st.session_state.topics_learned:
+            st.markdown("### 📚 Topics You've Learned")
+            for topic in st.session_state.topics_learned:
+                st.write(f"✅ {topic}")
+        
+        st.markdown("### 🎯 Agent's Recommendations")
+        st.info("The AI agent continuously adapts to your learning style and pace!")
+        
+        if st.session_state.current_content:
+            with st.spinner("Generating personalized recommendations..."):
+                exercises = st.session_state.agent.generate_practice_exercises(
+                    st.session_state.analysis.get('main_topic', 'General') if st.session_state.analysis else 'General',
+                    profile['difficulty_level']
+                )
+                
+                st.markdown("### 📚 Recommended Practice Exercises")
+                for exercise in exercises[:5]:
+                    st.write(exercise)
+
+def _shift_insights_page(step: int):
+    """Button callback: move the Insights decision log one page newer (-1) or older (+1)"""
+    st.session_state.insights_page = max(0, st.session_state.insights_page + step)
+
+@st.fragment
+def insights_fragment():
+    """Agent insights; reruns only this block and pages through the decision log"""
+    st.markdown(FEATURE_BOX_WHAT_IS_AGENTIC, unsafe_allow_html=True)
+    
+    if st.session_state.agent:
+        # Agent Decision Log
+        st.markdown("### 🧠 Agent's Autonomous Decision Log")
+        st.caption("Real-time view of the agent's reasoning and decision-making process")
+        
+        decision_log = st.session_state.agent.decision_log
+        if decision_log:
+            # Newest first, one page at a time
+            page_count = -(-len(decision_log) // INSIGHTS_PAGE_SIZE)  # Ceiling division
+            # Clamp: the log may have shrunk or a stale click may have pushed the page out of range
+            page = max(0, min(st.session_state.insights_page, page_count - 1))
+            st.session_state.insights_page = page
+            if page_count > 1:
+                col_newer, col_page, col_older = st.columns([1, 2, 1])
+                # Callbacks change the page before this rerun, so the buttons' disabled state is current
+                with col_newer:
+                    st.button("⬅️ Newer", disabled=page == 0, on_click=_shift_insights_page, args=(-1,))
+                with col_older:
+                    st.button("Older ➡️", disabled=page == page_count - 1, on_click=_shift_insights_page, args=(1,))
+                with col_page:
+                    st.caption(f"Page {page + 1} of {page_count}")
+            
+            start = page * INSIGHTS_PAGE_SIZE
+            page_decisions = islice(reversed(decision_log), start, start + INSIGHTS_PAGE_SIZE)
+            # The whole page goes out as one markdown element rather than several per decision
+            st.markdown("\n\n".join(DECISION_ENTRY_MD.format_map(decision) for decision in page_decisions))
+        else:
+            st.info("Start learning to see the agent's decision-making process!")
+        
+        st.divider()
+        
+        # Agent's Strategic Recommendation
+        st.markdown("### 🎯 Agent's Strategic Recommendation")
+        st.caption("Agent autonomously analyzes your progress and suggests next steps")
+        
+        if st.button("🤔 Ask Agent: What Should I Do Next?", type="primary"):
+            with st.spinner("🤖 Agent is analyzing your learning state and deciding..."):
+                # Agent makes autonomous decision
+                context = {
+                    "topics_count": len(st.session_state.topics_learned),
+                    "quiz_scores": st.session_state.quiz_scores,
+                    "quiz_score": st.session_state.quiz_scores[-1]['score'] if st.session_state.quiz_scores else 0
+                }
+                
+                decision = st.session_state.agent.decide_next_action(context)
+                
+                st.markdown(STRATEGIC_DECISION_HTML.format(
+                    action=decision['action'].replace('_', ' ').title(),
+                    priority=decision['priority'].upper(),
+                    reasoning=decision['reasoning'],
+                    suggestion=decision['suggested_content']
+                ), unsafe_allow_html=True)
+        
+        st.divider()
+        
+        # Student Profile Analysis
+        st.markdown("### 👤 Student Profile (Agent's Understanding)")
+        st.caption("How the agent perceives and tracks your learning journey")
+        
+        profile = st.session_state.agent.student_profile
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Learning Level", profile['difficulty_level'].title())
+            st.metric("Learning Style", profile['learning_style'].title())
+        
+        with col2:
+            st.metric("Topics Mastered", len(profile.get('topics_covered', [])))
+            st.metric("Active Weak Areas", len(profile.get('weak_areas', [])))
+        
+        with col3:
+            st.metric("Native Language", profile['language'])
+            st.metric("Engagement", profile.get('engagement_level', 'high').title())
+        
+        if profile.get('weak_areas'):
+            st.warning(f"🎯 **Agent Identified Weak Areas:** {', '.join(profile['weak_areas'][:3])}")
+        
+        st.divider()
+        
+        render_about_panel()
+
+def render_about_panel():
+    """Static capabilities and comparison panel, split out of the Insights tab"""
+    # Agentic Capabilities
+    st.markdown("### ⚡ Agent's Autonomous Capabilities")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(CAPABILITIES_LEFT_MD)
+    
+    with col2:
+        st.markdown(CAPABILITIES_RIGHT_MD)
+    
+    # Comparison (divider and heading are part of COMPARISON_HTML)
+    st.html(COMPARISON_HTML)  # Pure HTML, so skip the markdown parser
+
 def main():
     # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🌉 Education Language Bridge</h1>
-        <p>AI-Powered Multimodal Learning Assistant with True Agentic Behavior</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Sidebar configuration
     with st.sidebar:
@@ -138,18 +711,14 @@ def main():
         if st.session_state.agent:
             st.success("🟢 Agent Active")
             st.info(f"**Language:** {st.session_state.agent.native_language}")
-            st.info(f"**Level:** {st.session_state.agent.student_profile['difficulty_level']}")
+            st.info(f"**Level:** {st.session_state.agent.state.difficulty_level}")
             
             # Show Agent's Decision Log
             if st.session_state.agent.decision_log:
                 with st.expander("🧠 Agent Decision Log", expanded=False):
                     st.caption("See the agent's autonomous reasoning")
-                    for decision in st.session_state.agent.decision_log[-5:]:  # Show last 5
-                        st.markdown(f"""
-                        **{decision['type']}**  
-                        💭 Reasoning: {decision['reasoning']}  
-                        ⚡ Action: {decision['action']}
-                        """)
+                    for decision in list(st.session_state.agent.decision_log)[-5:]:  # Show last 5
+                        st.markdown(SIDEBAR_DECISION_MD.format_map(decision))
                         st.divider()
         else:
             st.warning("🔴 Agent Not Initialized")
@@ -157,15 +726,7 @@ def main():
         st.divider()
         
         st.header("📊 Features")
-        st.markdown("""
-        - 🖼️ Image Analysis
-        - 📄 PDF Processing
-        - 💬 Doubt Clarification
-        - 📝 Quiz Generation
-        - 🎯 Adaptive Learning
-        - 🔄 Real-time Translation
-        - 📊 Progress Tracking
-        """)
+        st.markdown(SIDEBAR_FEATURES_MD)
     
     # Main content area
     if not st.session_state.agent:
@@ -174,28 +735,13 @@ def main():
         # Show demo features
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.markdown("""
-            <div class="feature-box">
-                <h3>🎯 Agentic Behavior</h3>
-                <p>AI autonomously plans learning paths, adapts difficulty, and provides personalized explanations</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FEATURE_BOX_AGENTIC, unsafe_allow_html=True)
         
         with col2:
-            st.markdown("""
-            <div class="feature-box">
-                <h3>🌍 Multimodal Input</h3>
-                <p>Process images, PDFs, text, and audio for comprehensive learning</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FEATURE_BOX_MULTIMODAL, unsafe_allow_html=True)
         
         with col3:
-            st.markdown("""
-            <div class="feature-box">
-                <h3>🗣️ Native Language</h3>
-                <p>Learn complex topics in your mother tongue with cultural context</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(FEATURE_BOX_NATIVE, unsafe_allow_html=True)
         
         return
     
@@ -238,18 +784,13 @@ def main():
             if content:
                 with st.spinner("🧠 AI Agent is analyzing content and creating learning plan..."):
                     # Show agent thinking process
-                    st.markdown("""
-                    <div class="agent-thinking">
-                        <h4>🤖 Agent Thinking Process:</h4>
-                        <p>1. Analyzing content complexity and key concepts...</p>
-                        <p>2. Planning optimal learning sequence...</p>
-                        <p>3. Generating culturally-contextualized explanations...</p>
-                        <p>4. Preparing interactive elements...</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    # Placeholder so the thinking box is cleared once the analysis arrives
+                    thinking = st.empty()
+                    thinking.markdown(AGENT_THINKING_LEARN, unsafe_allow_html=True)
                     
                     # Agent analyzes content
                     analysis = st.session_state.agent.analyze_content(content)
+                    thinking.empty()
                     st.session_state.analysis = analysis
                     st.session_state.current_content = content
                     
@@ -266,36 +807,28 @@ def main():
                         if 'key_concepts' in analysis:
                             st.info(f"**Key Concepts:** {', '.join(analysis['key_concepts'][:3])}")
                     
-                    # Generate translation and explanation
-                    explanation = st.session_state.agent.translate_and_explain(content, analysis)
-                    
-                    st.markdown("### 📖 Your Personalized Lesson")
-                    st.markdown(explanation)
-                    
-                    # Generate summary
-                    summary = st.session_state.agent.generate_summary(content)
-                    
-                    st.markdown("### 📌 Quick Summary")
-                    st.markdown(summary)
-                    
                     # Track topic learned
                     if 'main_topic' in analysis and analysis['main_topic'] not in st.session_state.topics_learned:
-                        st.session_state.topics_learned.append(analysis['main_topic'])
+                        st.session_state.topics_learned.setdefault(analysis['main_topic'], None)
                         # Update agent profile
                         if st.session_state.agent:
-                            st.session_state.agent.student_profile['topics_covered'].append(analysis['main_topic'])
+                            st.session_state.agent.add_to_profile('topics_covered', analysis['main_topic'])
+                    
+                    # Summary and next-topic suggestion are generated while the lesson streams in
+                    extras = st.session_state.agent.start_lesson_extras(content, analysis)
+                    
+                    st.markdown("### 📖 Your Personalized Lesson")
+                    st.write_stream(st.session_state.agent.translate_and_explain_stream(content, analysis))
+                    
+                    materials = extras.result()
+                    st.markdown("### 📌 Quick Summary")
+                    st.markdown(materials['summary'])
                     
                     # Agent proactively suggests next topic
-                    if 'main_topic' in analysis:
-                        with st.spinner("🤖 Agent is thinking about your next learning step..."):
-                            next_topic = st.session_state.agent.suggest_next_topic(analysis['main_topic'])
-                            st.info(f"💡 **Agent's Proactive Suggestion:** Consider learning about '{next_topic}' next!")
+                    if materials['next_topic']:
+                        st.info(f"💡 **Agent's Proactive Suggestion:** Consider learning about '{materials['next_topic']}' next!")
                     
-                    st.markdown("""
-                    <div class="success-box">
-                        ✅ Learning material prepared! Check the Practice Quiz tab for exercises.
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(LESSON_READY_HTML, unsafe_allow_html=True)
             else:
                 st.warning("Please enter some content to learn")
     
@@ -307,25 +840,20 @@ def main():
         additional_context = st.text_input("Additional context or specific question about the image:")
         
         if uploaded_image:
-            image = Image.open(uploaded_image)
-            st.image(image, caption="Uploaded Image", use_column_width=True)
+            image = _decode_image(uploaded_image)
+            st.image(image, caption="Uploaded Image", use_container_width=True)
             
             if st.button("🤖 Agent: Analyze & Explain Image", type="primary"):
                 with st.spinner("🔍 Agent is analyzing the image..."):
-                    st.markdown("""
-                    <div class="agent-thinking">
-                        <h4>🤖 Agent Vision Process:</h4>
-                        <p>1. Detecting visual elements and text...</p>
-                        <p>2. Understanding educational context...</p>
-                        <p>3. Generating native language explanation...</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    thinking = st.empty()
+                    thinking.markdown(AGENT_THINKING_VISION, unsafe_allow_html=True)
                     
                     # Prepare image for Gemini
                     explanation = st.session_state.agent.analyze_multimodal_input(
                         image_data=image,
                         text=additional_context
                     )
+                    thinking.empty()
                     
                     st.markdown("### 🎯 Image Explanation")
                     st.markdown(explanation)
@@ -336,400 +864,25 @@ def main():
         
         st.markdown("Ask your doubts in any language - the agent will help!")
         
-        # Display chat history
-        for chat in st.session_state.chat_history:
-            with st.chat_message("user"):
-                st.write(chat['question'])
-            with st.chat_message("assistant"):
-                st.write(chat['answer'])
-        
-        # Chat input
-        user_question = st.chat_input("Ask your doubt here...")
-        
-        if user_question:
-            # Add to chat
-            with st.chat_message("user"):
-                st.write(user_question)
-            
-            with st.chat_message("assistant"):
-                with st.spinner("🤖 Agent is thinking..."):
-                    answer = st.session_state.agent.clarify_doubt(
-                        user_question,
-                        st.session_state.current_content
-                    )
-                    st.write(answer)
-            
-            # Update history
-            st.session_state.chat_history.append({
-                'question': user_question,
-                'answer': answer
-            })
-            st.rerun()
+        chat_fragment()
     
     # Tab 4: Practice Quiz
     with tab4:
         st.header("📝 Adaptive Practice Quiz")
         
-        if st.session_state.current_content:
-            difficulty = st.select_slider(
-                "Difficulty Level",
-                options=["easy", "medium", "hard"],
-                value="medium"
-            )
-            
-            if st.button("🤖 Agent: Generate Quiz", type="primary"):
-                with st.spinner("📝 Agent is creating personalized quiz..."):
-                    quiz = st.session_state.agent.generate_interactive_quiz(
-                        st.session_state.current_content,
-                        difficulty
-                    )
-                    st.session_state.quiz = quiz
-                    st.session_state.quiz_submitted = False  # Reset submission status
-            
-            if st.session_state.quiz:
-                st.markdown("### 🎯 Your Personalized Quiz")
-                
-                for idx, question in enumerate(st.session_state.quiz):
-                    st.markdown(f"#### Question {idx + 1}")
-                    st.write(question.get('question', ''))
-                    
-                    # Only MCQ questions
-                    answer = st.radio(
-                        "Select your answer:",
-                        question.get('options', []),
-                        key=f"q_{idx}"
-                    )
-                    st.session_state.quiz_answers[idx] = answer
-                    
-                    # Show explanation only after quiz is submitted
-                    if st.session_state.quiz_submitted:
-                        user_answer = st.session_state.quiz_answers.get(idx, "")
-                        correct_answer = question.get('correct', '')
-                        is_correct = str(user_answer).strip().lower() == str(correct_answer).strip().lower()
-                        
-                        if is_correct:
-                            st.success(f"✅ Correct! {question.get('explanation', '')}")
-                        else:
-                            st.error(f"❌ Incorrect. Correct answer: {correct_answer}")
-                            st.info(f"💡 Explanation: {question.get('explanation', '')}")
-                
-                if st.button("✅ Submit Quiz"):
-                    # Mark quiz as submitted
-                    st.session_state.quiz_submitted = True
-                    
-                    with st.spinner("🤖 Agent is analyzing your performance..."):
-                        # Calculate score
-                        correct_count = 0
-                        total_questions = len(st.session_state.quiz)
-                        
-                        # Analyze each answer
-                        results = []
-                        for idx, question in enumerate(st.session_state.quiz):
-                            user_answer = st.session_state.quiz_answers.get(idx, "")
-                            correct_answer = question.get('correct', '')
-                            
-                            is_correct = str(user_answer).strip().lower() == str(correct_answer).strip().lower()
-                            if is_correct:
-                                correct_count += 1
-                            
-                            results.append({
-                                'question': question.get('question'),
-                                'user_answer': user_answer,
-                                'correct_answer': correct_answer,
-                                'is_correct': is_correct
-                            })
-                        
-                        # Calculate percentage
-                        score_percentage = (correct_count / total_questions * 100) if total_questions > 0 else 0
-                        
-                        # Agent adaptive learning
-                        if score_percentage >= 80:
-                            adaptation = {
-                                'next_action': 'move_forward',
-                                'recommended_difficulty': 'advanced' if difficulty == 'hard' else 'hard',
-                                'feedback': 'Excellent! You have mastered this topic.'
-                            }
-                        elif score_percentage >= 60:
-                            adaptation = {
-                                'next_action': 'review',
-                                'recommended_difficulty': difficulty,
-                                'feedback': 'Good progress! Review the concepts and try again.'
-                            }
-                        else:
-                            adaptation = {
-                                'next_action': 'deep_dive',
-                                'recommended_difficulty': 'easy' if difficulty == 'hard' else difficulty,
-                                'feedback': 'Let\'s take it slower. I\'ll explain the concepts in more detail.'
-                            }
-                    
-                    # Display results
-                    st.markdown("---")
-                    st.markdown("### 📊 Quiz Results")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Score", f"{correct_count}/{total_questions}")
-                    with col2:
-                        st.metric("Percentage", f"{score_percentage:.0f}%")
-                    with col3:
-                        if score_percentage >= 80:
-                            st.metric("Grade", "A", delta="Excellent")
-                        elif score_percentage >= 60:
-                            st.metric("Grade", "B", delta="Good")
-                        else:
-                            st.metric("Grade", "C", delta="Needs Improvement")
-                    
-                    # Agent's feedback
-                    st.markdown(f"""
-                    <div class="{'success-box' if score_percentage >= 80 else 'agent-thinking'}">
-                        <h4>🤖 Agent's Analysis:</h4>
-                        <p><strong>Performance:</strong> {adaptation['feedback']}</p>
-                        <p><strong>Next Step:</strong> {adaptation['next_action'].replace('_', ' ').title()}</p>
-                        <p><strong>Recommended Level:</strong> {adaptation['recommended_difficulty'].title()}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Detailed breakdown
-                    with st.expander("📋 Detailed Answer Review"):
-                        for idx, result in enumerate(results):
-                            if result['is_correct']:
-                                st.success(f"✅ **Q{idx+1}:** Correct!")
-                            else:
-                                st.error(f"❌ **Q{idx+1}:** Incorrect")
-                                st.write(f"Your answer: {result['user_answer']}")
-                                st.write(f"Correct answer: {result['correct_answer']}")
-                    
-                    if score_percentage >= 80:
-                        st.balloons()
-                    
-                    # Track quiz score
-                    st.session_state.quiz_scores.append({
-                        'score': score_percentage,
-                        'correct': correct_count,
-                        'total': total_questions,
-                        'difficulty': difficulty
-                    })
-                    
-                    # Update student profile
-                    st.session_state.agent.student_profile['difficulty_level'] = adaptation['recommended_difficulty']
-                    
-                    # Force rerun to show explanations
-                    st.rerun()
-        else:
-            st.info("📚 Please learn some content first in the 'Learn Content' tab")
+        quiz_fragment()
     
     # Tab 5: Progress
     with tab5:
         st.header("📊 Your Learning Progress")
         
-        if st.session_state.agent:
-            profile = st.session_state.agent.student_profile
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Current Level", profile['difficulty_level'].title())
-            
-            with col2:
-                st.metric("Topics Covered", len(st.session_state.topics_learned))
-            
-            with col3:
-                st.metric("Doubts Clarified", len(st.session_state.chat_history))
-            
-            # Quiz performance
-            if st.session_state.quiz_scores:
-                st.markdown("### 📈 Quiz Performance")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    avg_score = sum(q['score'] for q in st.session_state.quiz_scores) / len(st.session_state.quiz_scores)
-                    st.metric("Average Score", f"{avg_score:.1f}%")
-                
-                with col2:
-                    st.metric("Quizzes Taken", len(st.session_state.quiz_scores))
-                
-                with col3:
-                    total_correct = sum(q['correct'] for q in st.session_state.quiz_scores)
-                    total_questions = sum(q['total'] for q in st.session_state.quiz_scores)
-                    st.metric("Total Correct", f"{total_correct}/{total_questions}")
-                
-                # Score history
-                with st.expander("📊 View Score History"):
-                    for idx, quiz_score in enumerate(st.session_state.quiz_scores):
-                        st.write(f"**Quiz {idx+1}:** {quiz_score['correct']}/{quiz_score['total']} ({quiz_score['score']:.0f}%) - Difficulty: {quiz_score['difficulty']}")
-            
-            # Topics learned
-            if st.session_state.topics_learned:
-                st.markdown("### 📚 Topics You've Learned")
-                for topic in st.session_state.topics_learned:
-                    st.write(f"✅ {topic}")
-            
-            st.markdown("### 🎯 Agent's Recommendations")
-            st.info("The AI agent continuously adapts to your learning style and pace!")
-            
-            if st.session_state.current_content:
-                with st.spinner("Generating personalized recommendations..."):
-                    exercises = st.session_state.agent.generate_practice_exercises(
-                        st.session_state.analysis.get('main_topic', 'General') if st.session_state.analysis else 'General',
-                        profile['difficulty_level']
-                    )
-                    
-                    st.markdown("### 📚 Recommended Practice Exercises")
-                    for exercise in exercises[:5]:
-                        if exercise.strip():
-                            st.write(exercise)
+        progress_fragment()
     
     # Tab 6: Agent Insights
     with tab6:
         st.header("🤖 Agent Insights - Agentic Behavior Dashboard")
         
-        st.markdown("""
-        <div class="feature-box">
-            <h3>🎯 What is Agentic Behavior?</h3>
-            <p>This AI agent demonstrates <strong>true autonomy</strong> by making decisions, planning learning paths, 
-            and adapting strategies without explicit instructions. Watch how it thinks and acts independently!</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        if st.session_state.agent:
-            # Agent Decision Log
-            st.markdown("### 🧠 Agent's Autonomous Decision Log")
-            st.caption("Real-time view of the agent's reasoning and decision-making process")
-            
-            if st.session_state.agent.decision_log:
-                for idx, decision in enumerate(reversed(st.session_state.agent.decision_log)):
-                    with st.expander(f"Decision #{len(st.session_state.agent.decision_log) - idx}: {decision['type']}", expanded=(idx < 2)):
-                        col1, col2 = st.columns([1, 2])
-                        with col1:
-                            st.markdown(f"**Type:** {decision['type']}")
-                            st.markdown(f"**Step:** {decision['timestamp']}")
-                        with col2:
-                            st.markdown(f"**💭 Agent's Reasoning:**")
-                            st.info(decision['reasoning'])
-                            st.markdown(f"**⚡ Action Taken:**")
-                            st.success(decision['action'])
-            else:
-                st.info("Start learning to see the agent's decision-making process!")
-            
-            st.divider()
-            
-            # Agent's Strategic Recommendation
-            st.markdown("### 🎯 Agent's Strategic Recommendation")
-            st.caption("Agent autonomously analyzes your progress and suggests next steps")
-            
-            if st.button("🤔 Ask Agent: What Should I Do Next?", type="primary"):
-                with st.spinner("🤖 Agent is analyzing your learning state and deciding..."):
-                    # Agent makes autonomous decision
-                    context = {
-                        "topics_count": len(st.session_state.topics_learned),
-                        "quiz_scores": st.session_state.quiz_scores,
-                        "quiz_score": st.session_state.quiz_scores[-1]['score'] if st.session_state.quiz_scores else 0
-                    }
-                    
-                    decision = st.session_state.agent.decide_next_action(context)
-                    
-                    st.markdown(f"""
-                    <div class="agent-thinking">
-                        <h4>🤖 Agent's Autonomous Decision:</h4>
-                        <p><strong>Recommended Action:</strong> {decision['action'].replace('_', ' ').title()}</p>
-                        <p><strong>Priority:</strong> {decision['priority'].upper()}</p>
-                        <p><strong>Agent's Reasoning:</strong> {decision['reasoning']}</p>
-                        <p><strong>Suggestion:</strong> {decision['suggested_content']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            st.divider()
-            
-            # Student Profile Analysis
-            st.markdown("### 👤 Student Profile (Agent's Understanding)")
-            st.caption("How the agent perceives and tracks your learning journey")
-            
-            profile = st.session_state.agent.student_profile
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Learning Level", profile['difficulty_level'].title())
-                st.metric("Learning Style", profile['learning_style'].title())
-            
-            with col2:
-                st.metric("Topics Mastered", len(profile.get('topics_covered', [])))
-                st.metric("Active Weak Areas", len(profile.get('weak_areas', [])))
-            
-            with col3:
-                st.metric("Native Language", profile['language'])
-                st.metric("Engagement", profile.get('engagement_level', 'high').title())
-            
-            if profile.get('weak_areas'):
-                st.warning(f"🎯 **Agent Identified Weak Areas:** {', '.join(profile['weak_areas'][:3])}")
-            
-            st.divider()
-            
-            # Agentic Capabilities
-            st.markdown("### ⚡ Agent's Autonomous Capabilities")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                **✅ Planning & Strategy:**
-                - Analyzes content difficulty autonomously
-                - Creates multi-step learning sequences
-                - Plans personalized teaching approaches
-                
-                **✅ Adaptation & Learning:**
-                - Adjusts difficulty based on performance
-                - Identifies misconceptions automatically
-                - Updates teaching strategy in real-time
-                """)
-            
-            with col2:
-                st.markdown("""
-                **✅ Proactive Behavior:**
-                - Suggests next topics without prompting
-                - Recommends learning actions strategically
-                - Detects when review is needed
-                
-                **✅ Contextual Understanding:**
-                - Maintains student learning history
-                - Tracks strengths and weaknesses
-                - Adapts to cultural context
-                """)
-            
-            st.divider()
-            
-            # Comparison
-            st.markdown("### 📊 Traditional AI vs Agentic AI")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                <div style="background-color: #f8f9fa; padding: 1rem; border-radius: 8px;">
-                    <h4>🔹 Traditional AI</h4>
-                    <ul>
-                        <li>Waits for user commands</li>
-                        <li>Provides static responses</li>
-                        <li>No memory or adaptation</li>
-                        <li>One-size-fits-all approach</li>
-                        <li>Reactive only</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div style="background-color: #d4edda; padding: 1rem; border-radius: 8px;">
-                    <h4>🌟 Our Agentic AI</h4>
-                    <ul>
-                        <li><strong>Autonomous decision-making</strong></li>
-                        <li><strong>Dynamic adaptation</strong></li>
-                        <li><strong>Persistent memory & learning</strong></li>
-                        <li><strong>Personalized strategies</strong></li>
-                        <li><strong>Proactive & Reactive</strong></li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+        insights_fragment()
 
 if __name__ == "__main__":
     main()
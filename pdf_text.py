@@ -0,0 +1,14 @@
+"""
+PDF text extraction for Education Language Bridge
+"""
+
+import pymupdf
+
+
+def extract_pdf_text(pdf_bytes: bytes) -> str:
+    """
+    Extract all text from a PDF, page by page in a single pass.
+    MuPDF needs about a millisecond per page, so this runs serially in the calling thread.
+    """
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return "\n".join(page.get_text("text") for page in doc).strip()